@@ -1,58 +1,68 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
-import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 import logging
 
+# Locators
+MOIST_BTN = (By.XPATH, "//button[contains(text(), 'moisturizers')]")
+PRODUCTS = (By.CSS_SELECTOR, ".col-4")
+CART_LINK = (By.CSS_SELECTOR, "button[onclick*='goToCart']")
+CART_COUNTER = (By.ID, "cart")
+CART_ROWS = (By.CSS_SELECTOR, "table tbody tr")
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Setup driver
 options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
+options.add_argument("--headless=new")
+options.add_argument("--disable-gpu")
+options.add_argument("--window-size=1920,1080")
+options.add_argument("--blink-settings=imagesEnabled=false")
+options.page_load_strategy = "eager"  # return on DOMContentLoaded
 driver = webdriver.Chrome(options=options)
 
 try:
     # Go to homepage
     driver.get("https://weathershopper.pythonanywhere.com")
     logging.info("Opened homepage")
-    time.sleep(2)
     
     # Click moisturizers 
-    driver.find_element(By.XPATH, "//button[contains(text(), 'moisturizers')]").click()
+    WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable(MOIST_BTN)
+    ).click()
     logging.info("Clicked on moisturizers")
-    time.sleep(2)
     
-    # Find the first product and its Add button
-    product_elements = driver.find_elements(By.CSS_SELECTOR, ".col-4")
+    # Wait for the product cards to render
+    product_elements = WebDriverWait(driver, 10).until(
+        EC.presence_of_all_elements_located(PRODUCTS)
+    )
     if product_elements:
-        product = product_elements[0]  # First product
-        product_name = product.find_element(By.TAG_NAME, "p").text.strip()
-        
         # Get cart text before adding
-        cart_before = driver.find_element(By.XPATH, "//a[contains(@href, '/cart')]").text
+        cart_before = driver.find_element(*CART_LINK).text
         logging.info(f"Cart before adding: {cart_before}")
         
-        # Find and click Add button using JavaScript
-        add_button = product.find_element(By.TAG_NAME, "button")
-        driver.execute_script("arguments[0].scrollIntoView(true);", add_button)
-        time.sleep(1)
-        
-        # THIS IS KEY: Instead of using the regular click, let's execute the JavaScript function directly
-        # First, we need to extract the product name and price from the onclick attribute
-        onclick_attr = add_button.get_attribute("onclick")
-        logging.info(f"Button onclick attribute: {onclick_attr}")
+        # Click every Add button in a single browser call; the onclick handler
+        # (addToCart(name, price)) runs for each one and we get the names back
+        added = driver.execute_script("""
+            const out = [];
+            document.querySelectorAll('.col-4 button').forEach(b => {
+                out.push(b.closest('.col-4').querySelector('p').innerText.trim());
+                b.click();
+            });
+            return out;
+        """)
+        logging.info(f"Adding products: {added}")
         
-        # Click using both methods to ensure it works
-        logging.info(f"Adding product: {product_name}")
-        driver.execute_script("arguments[0].click();", add_button)
-        
-        # Wait to see if cart updates
-        time.sleep(3)
-        
-        # Get cart text after adding
+        # Wait for the cart counter to reach the number of products added
         try:
-            cart_after = driver.find_element(By.XPATH, "//a[contains(@href, '/cart')]").text
+            WebDriverWait(driver, 10).until(
+                lambda d: d.find_element(*CART_COUNTER).text.startswith(str(len(added)))
+            )
+            cart_after = driver.find_element(*CART_LINK).text
             logging.info(f"Cart after adding: {cart_after}")
         except:
             logging.info("Could not find cart text after adding")
@@ -60,13 +70,17 @@ try:
         # Take screenshot
         driver.save_screenshot("after_add_product.png")
         
-        # Navigate to cart page
-        driver.get("https://weathershopper.pythonanywhere.com/cart")
+        # Navigate to cart page through the navbar button instead of a full reload
+        driver.find_element(*CART_LINK).click()
         logging.info("Navigated to cart page")
-        time.sleep(3)
         
         # Check if cart has items
-        cart_items = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+        try:
+            cart_items = WebDriverWait(driver, 10).until(
+                EC.presence_of_all_elements_located(CART_ROWS)
+            )
+        except TimeoutException:
+            cart_items = []
         logging.info(f"Found {len(cart_items)} items in cart")
         
         # Take screenshot of cart page
@@ -74,10 +88,11 @@ try:
         
         # Check page source
         page_source = driver.page_source
-        if product_name in page_source:
-            logging.info(f"Product '{product_name}' found in cart page source")
-        else:
-            logging.info(f"Product '{product_name}' NOT found in cart page source")
+        for product_name in added:
+            if product_name in page_source:
+                logging.info(f"Product '{product_name}' found in cart page source")
+            else:
+                logging.info(f"Product '{product_name}' NOT found in cart page source")
     else:
         logging.error("No products found")
 
@@ -3,9 +3,28 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 import time
 
+# Locators
+MOIST_BTN = (By.XPATH, "//button[contains(text(), 'moisturizers')]")
+
+# Candidate selectors for product cards
+SELECTORS_TO_TRY = (
+    ".text-center.col-4",
+    ".col-4",
+    ".text-center",
+    "[class*='col-4']",
+    "[class*='text-center']",
+    ".card",
+    ".product",
+    "div.col-4",
+)
+
 # Setup driver
 options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
+options.add_argument("--headless=new")
+options.add_argument("--disable-gpu")
+options.add_argument("--window-size=1920,1080")
+options.add_argument("--blink-settings=imagesEnabled=false")
+options.page_load_strategy = "eager"  # return on DOMContentLoaded
 service = Service(executable_path="C:\\webdrivers\\chromedriver.exe")
 driver = webdriver.Chrome(service=service, options=options)
 
@@ -15,36 +34,37 @@ try:
     time.sleep(2)
     
     # Click moisturizers (assuming temperature < 19)
-    moisturizers_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'moisturizers')]")
+    moisturizers_btn = driver.find_element(*MOIST_BTN)
     moisturizers_btn.click()
     time.sleep(3)
     
     # Try different selectors to find products
-    selectors_to_try = [
-        ".text-center.col-4",
-        ".col-4",
-        ".text-center",
-        "[class*='col-4']",
-        "[class*='text-center']",
-        ".card",
-        ".product",
-        "div.col-4"
-    ]
-    
     print("=== DEBUGGING PRODUCT SELECTORS ===")
-    for selector in selectors_to_try:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            print(f"Selector '{selector}': Found {len(elements)} elements")
-            
-            # If we found elements, show first few
-            for i, elem in enumerate(elements[:3]):
-                try:
-                    print(f"  Element {i}: {elem.text[:100]}...")
-                except:
-                    print(f"  Element {i}: [Could not get text]")
-        except Exception as e:
-            print(f"Selector '{selector}': Error - {e}")
+    # Run every selector in the browser with one call instead of one per selector
+    results = driver.execute_script("""
+        return arguments[0].map(sel => {
+            try {
+                const elements = document.querySelectorAll(sel);
+                return {
+                    selector: sel,
+                    count: elements.length,
+                    samples: Array.from(elements).slice(0, 3).map(e => e.innerText.slice(0, 100))
+                };
+            } catch (e) {
+                return {selector: sel, error: e.message};
+            }
+        });
+    """, list(SELECTORS_TO_TRY))
+    
+    for result in results:
+        if "error" in result:
+            print(f"Selector '{result['selector']}': Error - {result['error']}")
+            continue
+        print(f"Selector '{result['selector']}': Found {result['count']} elements")
+        
+        # If we found elements, show first few
+        for i, sample in enumerate(result["samples"]):
+            print(f"  Element {i}: {sample}...")
     
     # Also check page source for common product indicators
     page_source = driver.page_source
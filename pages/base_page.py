@@ -5,31 +5,83 @@ Base Page Object Model class with common functionality
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+
+class CachedElement:
+    """
+    Descriptor that locates an element once per page object and reuses it.
+
+    The element is looked up again when the cached reference has gone stale
+    (e.g. after a navigation), mirroring Selenium's @CacheLookup.
+    """
+    
+    def __init__(self, locator):
+        self.locator = locator
+    
+    def __set_name__(self, owner, name):
+        self._attr = f"_cached_{name}"
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        element = instance.__dict__.get(self._attr)
+        if element is not None:
+            try:
+                element.is_enabled()  # cheap call that raises if stale
+                return element
+            except StaleElementReferenceException:
+                pass
+        element = instance.find_element(self.locator)
+        instance.__dict__[self._attr] = element
+        return element
 
 
 class BasePage:
-    """Base page class that contains common functionality for all pages"""
+    """
+    Base page class that contains common functionality for all pages.
+    
+    Page objects rely exclusively on explicit WebDriverWait conditions, so the
+    driver's implicit wait is forced to 0 to keep the two from compounding.
+    Helpers that give up waiting re-raise TimeoutException with the locator in
+    the message, so callers can tell a timeout apart from other failures.
+    """
+    
+    DEFAULT_TIMEOUT = 10
+    POLL_FREQUENCY = 0.1  # seconds between condition checks in explicit waits
     
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.driver.implicitly_wait(0)
+        self._waits = {}
+        self.wait = self._get_wait(self.DEFAULT_TIMEOUT)
+    
+    def _get_wait(self, timeout):
+        """Return a cached WebDriverWait for the given timeout"""
+        if timeout not in self._waits:
+            self._waits[timeout] = WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=self.POLL_FREQUENCY,
+                ignored_exceptions=(StaleElementReferenceException,)
+            )
+        return self._waits[timeout]
     
     def find_element(self, locator):
         """Find a single element with wait"""
         try:
             return self.wait.until(EC.presence_of_element_located(locator))
         except TimeoutException:
-            raise Exception(f"Element not found: {locator}")
+            raise TimeoutException(f"Element not found: {locator}")
     
     def find_elements(self, locator, timeout=10):
         """Find multiple elements with wait"""
         try:
-            return WebDriverWait(self.driver, timeout).until(
+            return self._get_wait(timeout).until(
                 EC.presence_of_all_elements_located(locator)
             )
         except TimeoutException:
-            raise Exception(f"Elements not found: {locator}")
+            raise TimeoutException(f"Elements not found: {locator}")
     
     def click_element(self, locator):
         """Click on element with wait for clickability"""
@@ -39,7 +91,7 @@ class BasePage:
             print(f"Clicked element: {locator}")
             return element
         except TimeoutException:
-            raise Exception(f"Element not clickable: {locator}")
+            raise TimeoutException(f"Element not clickable: {locator}")
     
     def send_keys_to_element(self, locator, text):
         """Send keys to element with wait"""
@@ -50,7 +102,7 @@ class BasePage:
             print(f"Sent keys to element: {locator}")
             return element
         except TimeoutException:
-            raise Exception(f"Element not found to send keys: {locator}")
+            raise TimeoutException(f"Element not found to send keys: {locator}")
     
     def get_element_text(self, locator):
         """Get text from element"""
@@ -60,7 +112,7 @@ class BasePage:
     def is_element_present(self, locator, timeout=5):
         """Check if element is present on page"""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._get_wait(timeout).until(
                 EC.presence_of_element_located(locator)
             )
             return True
@@ -70,16 +122,16 @@ class BasePage:
     def wait_for_element_visible(self, locator, timeout=10):
         """Wait for element to be visible"""
         try:
-            return WebDriverWait(self.driver, timeout).until(
+            return self._get_wait(timeout).until(
                 EC.visibility_of_element_located(locator)
             )
         except TimeoutException:
-            raise Exception(f"Element not visible: {locator}")
+            raise TimeoutException(f"Element not visible: {locator}")
     
     def is_element_interactable(self, locator, timeout=10):
         """Check if element is visible and enabled for clicking"""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._get_wait(timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             return True
@@ -3,10 +3,13 @@ Home Page Object - Weather Shopper Homepage
 Handles temperature reading and navigation to product categories
 """
 from selenium.webdriver.common.by import By
-from pages.base_page import BasePage
+from pages.base_page import BasePage, CachedElement
 import re
 
 
+_TEMP_RE = re.compile(r'\d+')
+
+
 class HomePage(BasePage):
     """Page object for Weather Shopper homepage"""
     
@@ -15,8 +18,37 @@ class HomePage(BasePage):
     
     # Locators
     TEMPERATURE_DISPLAY = (By.ID, "temperature")
-    MOISTURIZERS_BUTTON = (By.XPATH, "//button[contains(text(), 'moisturizers')]")
-    SUNSCREENS_BUTTON = (By.XPATH, "//button[contains(text(), 'sunscreens')]")
+    MOISTURIZERS_BUTTON = (By.CSS_SELECTOR, "a[href='/moisturizer'] button")
+    SUNSCREENS_BUTTON = (By.CSS_SELECTOR, "a[href='/sunscreen'] button")
+    
+    # Temperature thresholds (°C): below COLD buy moisturizers, above HOT buy sunscreens
+    COLD_THRESHOLD = 19
+    HOT_THRESHOLD = 34
+    
+    # Reads the temperature and clicks the matching category button in one round-trip.
+    # arguments: [cold threshold, hot threshold, moisturizer selector, sunscreen selector];
+    # the first number in the text is used, like _TEMP_RE; returns null if there is none
+    NAVIGATE_TO_CATEGORY_SCRIPT = """
+        const match = document.getElementById('temperature').innerText.match(/\\d+/);
+        if (!match) return null;
+        const temp = parseInt(match[0], 10);
+        if (temp < arguments[0]) {
+            document.querySelector(arguments[2]).click();
+            return 'moisturizers';
+        }
+        if (temp > arguments[1]) {
+            document.querySelector(arguments[3]).click();
+            return 'sunscreens';
+        }
+        return 'none';
+    """
+    
+    # Cached elements
+    temperature_display = CachedElement(TEMPERATURE_DISPLAY)
+    
+    def __init__(self, driver):
+        super().__init__(driver)
+        self._cached_temp = None
     
     def navigate_to_homepage(self):
         """
@@ -26,25 +58,38 @@ class HomePage(BasePage):
             HomePage: self instance for method chaining.
         """
         self.driver.get(self.URL)
+        self.invalidate_temperature_cache()
         return self
     
     def get_current_temperature(self):
         """
         Read the temperature displayed on homepage.
         
+        The parsed value is cached until the next navigation, so repeated
+        checks only read the DOM once.
+        
         Returns:
             int: Temperature value (e.g., 25 for "25°C").
         
         Raises:
             Exception: If temperature text parsing fails.
         """
-        temp_text = self.get_element_text(self.TEMPERATURE_DISPLAY)
+        if self._cached_temp is not None:
+            return self._cached_temp
+        
+        temp_text = self.temperature_display.text
         try:
-            temperature = int(re.search(r'\d+', temp_text).group())
-            return temperature
+            self._cached_temp = int(_TEMP_RE.search(temp_text).group())
+            return self._cached_temp
         except (AttributeError, ValueError) as e:
             raise Exception(f"Failed to parse temperature from text '{temp_text}': {e}")
     
+    def invalidate_temperature_cache(self):
+        """
+        Forget the cached temperature so the next read hits the page again.
+        """
+        self._cached_temp = None
+    
     def should_buy_moisturizers(self):
         """
         Check if temperature requires moisturizers (< 19°C).
@@ -52,7 +97,7 @@ class HomePage(BasePage):
         Returns:
             bool
         """
-        return self.get_current_temperature() < 19
+        return self.get_current_temperature() < self.COLD_THRESHOLD
     
     def should_buy_sunscreens(self):
         """
@@ -61,7 +106,7 @@ class HomePage(BasePage):
         Returns:
             bool
         """
-        return self.get_current_temperature() > 34
+        return self.get_current_temperature() > self.HOT_THRESHOLD
     
     def is_moderate_temperature(self):
         """
@@ -71,7 +116,7 @@ class HomePage(BasePage):
             bool
         """
         temp = self.get_current_temperature()
-        return 19 <= temp <= 34
+        return self.COLD_THRESHOLD <= temp <= self.HOT_THRESHOLD
     
     def click_moisturizers_button(self):
         """
@@ -81,6 +126,7 @@ class HomePage(BasePage):
             HomePage: self instance for method chaining.
         """
         self.click_element(self.MOISTURIZERS_BUTTON)
+        self.invalidate_temperature_cache()
         return self
     
     def click_sunscreens_button(self):
@@ -91,23 +137,35 @@ class HomePage(BasePage):
             HomePage: self instance for method chaining.
         """
         self.click_element(self.SUNSCREENS_BUTTON)
+        self.invalidate_temperature_cache()
         return self
     
     def navigate_to_appropriate_category(self):
         """
         Navigate to the appropriate product category based on temperature.
         
+        The temperature read and the button click happen in a single
+        browser-side script.
+        
         Returns:
             str: category navigated to ('moisturizers', 'sunscreens', 'none').
-        """
-        if self.should_buy_moisturizers():
-            self.click_moisturizers_button()
-            return 'moisturizers'
-        elif self.should_buy_sunscreens():
-            self.click_sunscreens_button()
-            return 'sunscreens'
-        else:
-            return 'none'  # Moderate temperature, no action needed
+        
+        Raises:
+            Exception: If the temperature text contains no number.
+        """
+        self.find_element(self.TEMPERATURE_DISPLAY)
+        category = self.driver.execute_script(
+            self.NAVIGATE_TO_CATEGORY_SCRIPT,
+            self.COLD_THRESHOLD,
+            self.HOT_THRESHOLD,
+            self.MOISTURIZERS_BUTTON[1],
+            self.SUNSCREENS_BUTTON[1]
+        )
+        if category is None:
+            raise Exception("Failed to parse temperature from the temperature display")
+        if category != 'none':  # A category page was opened, so the cached temperature is stale
+            self.invalidate_temperature_cache()
+        return category
     
     def is_moisturizers_button_visible(self, timeout=5):
         """
@@ -3,12 +3,20 @@ Payment Page Object - Stripe payment form handling
 Manages payment form filling and success verification
 """
 
+import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
 from selenium.webdriver.common.keys import Keys
-import time
+from selenium.common.exceptions import (
+    TimeoutException,
+    StaleElementReferenceException,
+    NoSuchFrameException
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class PaymentPage(BasePage):
@@ -21,7 +29,12 @@ class PaymentPage(BasePage):
     TEST_CVC = "123"
     TEST_ZIP = "12345"
 
+    # Type the card number in 4-digit chunks, for Stripe builds that drop fast input
+    TYPE_CARD_IN_CHUNKS = False
+
     # Locators (Stripe form fields are often in iframe)
+    STRIPE_IFRAME = (By.CSS_SELECTOR, "iframe[name^='stripe_checkout_app'], iframe[title*='Stripe']")
+    STRIPE_IFRAME_CANDIDATES = "iframe[name^='stripe_checkout_app'], iframe[title*='Stripe'], iframe[src*='stripe.com']"
     EMAIL_FIELD = (By.CSS_SELECTOR, "input[name='email']")
     CARD_NUMBER_FIELD = (By.CSS_SELECTOR, "input[name='cardnumber']")
     EXPIRY_FIELD = (By.CSS_SELECTOR, "input[name='exp-date']")
@@ -29,140 +42,214 @@ class PaymentPage(BasePage):
     ZIP_FIELD = (By.CSS_SELECTOR, "input[name='postal']")
     SUBMIT_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
 
-    # Alternative locators (fallbacks)
-    ALT_EMAIL_FIELD = (By.ID, "email")
-    ALT_CARD_FIELD = (By.ID, "card-number")
-    ALT_EXPIRY_FIELD = (By.ID, "card-expiry")
-    ALT_CVC_FIELD = (By.ID, "card-cvc")
-    ALT_ZIP_FIELD = (By.ID, "billing-zip")
+    # Combined locators: primary name, alternative ID and attribute fallbacks in one query.
+    # A plain find_elements on these returns matches in document order, so fields are
+    # looked up with FIRST_MATCH_SCRIPT, which tries the selectors in the order listed.
+    EMAIL_FIELDS = (By.CSS_SELECTOR, "input[name='email'], #email, input[type='email'], input[placeholder*='email' i]")
+    CARD_NUMBER_FIELDS = (By.CSS_SELECTOR, "input[name='cardnumber'], #card-number, input[placeholder*='card' i], input[placeholder*='carte' i], input[name*='card']")
+    EXPIRY_FIELDS = (By.CSS_SELECTOR, "input[name='exp-date'], #card-expiry, input[placeholder*='expir' i], input[placeholder*='MM'], input[aria-label*='Expiration'], input[name*='exp']")
+    CVC_FIELDS = (By.CSS_SELECTOR, "input[name='cvc'], #card-cvc, input[placeholder*='cvc' i], input[placeholder*='cvv' i], input[name*='cvc']")
+    ZIP_FIELDS = (By.CSS_SELECTOR, "input[name='postal'], #billing-zip, input[placeholder*='zip' i], input[placeholder*='postal' i], input[name*='postal']")
 
     # Success message locators
     SUCCESS_MESSAGE = (By.XPATH, "//*[contains(text(), 'Payment successful')]")
     ALT_SUCCESS_MESSAGE = (By.XPATH, "//*[contains(text(), 'success') or contains(text(), 'Success')]")
+    ANY_SUCCESS_MESSAGE = (By.XPATH, "//*[contains(text(), 'Payment successful') or contains(text(), 'success') or contains(text(), 'Success')]")
+
+    # Finds the iframe holding the payment fields among arguments[0] candidates;
+    # cross-origin frames cannot be inspected and are returned for probing
+    IFRAME_SCAN_SCRIPT = """
+        const frames = document.querySelectorAll(arguments[0]);
+        const crossOrigin = [];
+        for (const frame of frames) {
+            let doc = null;
+            try { doc = frame.contentDocument; } catch (e) {}
+            if (!doc) { crossOrigin.push(frame); continue; }
+            if (doc.querySelector("input[name='email']") || doc.querySelector("input[name='cardnumber']")) {
+                return {count: frames.length, match: frame, crossOrigin: crossOrigin};
+            }
+        }
+        return {count: frames.length, match: null, crossOrigin: crossOrigin};
+    """
+
+    # Returns the element for the first selector in the arguments[0] list that matches,
+    # so the primary locator wins over fallbacks regardless of document order
+    FIRST_MATCH_SCRIPT = """
+        for (const selector of arguments[0].split(',')) {
+            const el = document.querySelector(selector.trim());
+            if (el) return el;
+        }
+        return null;
+    """
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self._stripe_iframe = None
+
+    def _switch_to_stripe_iframe(self, timeout=10):
+        """
+        Switch into the Stripe Checkout iframe.
+        Reuses the iframe element located earlier and only waits for it again if it went stale.
+        """
+        if self._stripe_iframe is not None:
+            try:
+                self.driver.switch_to.frame(self._stripe_iframe)
+                return self._stripe_iframe
+            except (StaleElementReferenceException, NoSuchFrameException):
+                self._stripe_iframe = None
+
+        self._stripe_iframe = self._get_wait(timeout).until(
+            EC.presence_of_element_located(self.STRIPE_IFRAME)
+        )
+        self._get_wait(timeout).until(
+            EC.frame_to_be_available_and_switch_to_it(self._stripe_iframe)
+        )
+        return self._stripe_iframe
+
+    def _wait_for_field_value(self, field, digits, timeout=1):
+        """
+        Wait until an input's value, ignoring formatting, ends with the typed digits.
+        Stripe reformats card and expiry input, so only digits are compared.
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda d: ''.join(filter(str.isdigit, field.get_attribute("value") or '')).endswith(digits)
+            )
+        except TimeoutException:
+            logger.warning("Field value did not reflect '%s' within %ss, continuing.", digits, timeout)
 
     def wait_for_payment_form(self, timeout=15):
         """
         Wait for Stripe Checkout popup iframe and its fields to load.
-        Returns True if form appears within timeout, else False.
+        On success the driver stays inside the iframe so the form can be filled
+        without switching frames again.
+        Returns the Stripe iframe WebElement if form appears within timeout, else None.
         """
         try:
-            print(f"Waiting for Stripe iframe and payment form to load (timeout={timeout}s)...")
+            logger.debug("Waiting for Stripe iframe and payment form to load (timeout=%ss)...", timeout)
             # Wait for the Stripe iframe to appear
-            WebDriverWait(self.driver, timeout).until(
-                EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe[name^='stripe_checkout_app'], iframe[title*='Stripe']"))
-            )
+            iframe = self._switch_to_stripe_iframe(timeout)
             # Now inside the iframe, wait for the email field
-            WebDriverWait(self.driver, timeout).until(
+            self._get_wait(timeout).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email']"))
             )
-            print("Stripe payment form loaded successfully.")
-            # Switch back to default content for safety
-            self.driver.switch_to.default_content()
-            return True
+            logger.debug("Stripe payment form loaded successfully.")
+            return iframe
         except Exception as e:
-            print(f"[ERROR] Stripe payment form did not load within {timeout}s: {e}")
+            logger.error("Stripe payment form did not load within %ss: %s", timeout, e)
             self.driver.switch_to.default_content()
-            return False
+            return None
 
     def switch_to_stripe_iframe_if_needed(self):
         """
         Detect and switch to Stripe iframe if payment fields reside inside.
+        Only iframes matching Stripe name/title/src patterns are considered.
+        Same-origin candidates are inspected in a single browser-side script; only
+        cross-origin iframes, whose documents the script cannot read, are probed
+        one by one.
         Returns True if switched successfully, False otherwise.
         """
         try:
-            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-            print(f"Found {len(iframes)} iframe(s), scanning for Stripe payment form...")
+            scan = self.driver.execute_script(self.IFRAME_SCAN_SCRIPT, self.STRIPE_IFRAME_CANDIDATES)
+            logger.debug("Found %s Stripe iframe candidate(s), scanning for payment form...", scan['count'])
+
+            if scan['match'] is not None:
+                self.driver.switch_to.frame(scan['match'])
+                logger.debug("Switched to Stripe iframe containing payment form.")
+                return True
 
-            for iframe in iframes:
+            for iframe in scan['crossOrigin']:
                 try:
                     self.driver.switch_to.frame(iframe)
                     if self.is_element_present(self.EMAIL_FIELD, 2) or self.is_element_present(self.CARD_NUMBER_FIELD, 2):
-                        print("Switched to Stripe iframe containing payment form.")
+                        logger.debug("Switched to Stripe iframe containing payment form.")
                         return True
                     self.driver.switch_to.default_content()
                 except Exception as inner_e:
-                    print(f"[WARN] Error checking iframe for payment fields: {inner_e}")
+                    logger.warning("Error checking iframe for payment fields: %s", inner_e)
                     self.driver.switch_to.default_content()
                     continue
 
-            print("No Stripe iframe detected or payment fields not found in any iframe.")
+            logger.debug("No Stripe iframe detected or payment fields not found in any iframe.")
             return False
         except Exception as e:
-            print(f"[ERROR] Exception during iframe switching: {e}")
+            logger.error("Exception during iframe switching: %s", e)
             self.driver.switch_to.default_content()
             return False
 
+    def _find_field(self, locator, timeout=5):
+        """
+        Return the element matched by the earliest selector of a combined locator.
+        Waits up to timeout seconds; a single script call on the happy path.
+        """
+        return self._get_wait(timeout).until(
+            lambda d: d.execute_script(self.FIRST_MATCH_SCRIPT, locator[1])
+        )
+
+    def _fill_field(self, locator, value):
+        """Clear and type into the element matched by the earliest selector of a combined locator."""
+        try:
+            field = self._find_field(locator)
+        except TimeoutException:
+            raise TimeoutException(f"Element not found to send keys: {locator}")
+        field.clear()
+        field.send_keys(value)
+        return field
+
     def fill_email_field(self, email=None):
         """
         Fill the email input field in payment form.
-        Attempts multiple locator strategies before raising.
         """
         email = email or self.TEST_EMAIL
-        print(f"Filling email field with '{email}'...")
+        logger.debug("Filling email field with '%s'...", email)
 
         try:
-            if self.is_element_present(self.EMAIL_FIELD):
-                self.send_keys_to_element(self.EMAIL_FIELD, email)
-            elif self.is_element_present(self.ALT_EMAIL_FIELD):
-                self.send_keys_to_element(self.ALT_EMAIL_FIELD, email)
-            else:
-                # Attempt by common email input attributes
-                email_field = self.driver.find_element(
-                    By.XPATH, "//input[@type='email' or contains(@placeholder, 'email') or contains(@placeholder, 'Email')]"
-                )
-                email_field.clear()
-                email_field.send_keys(email)
-            print("Email field filled successfully.")
+            self._fill_field(self.EMAIL_FIELDS, email)
+            logger.debug("Email field filled successfully.")
         except Exception as e:
-            print(f"[ERROR] Failed to fill email field: {e}")
+            logger.error("Failed to fill email field: %s", e)
             raise
 
     def fill_card_number_field(self, card_number=None):
         """
         Fill card number field with provided or test card number.
         """
-        card_number = card_number or self.TEST_CARD_NUMBER
-        print(f"Filling card number field with '{card_number}'...")
+        card_number = (card_number or self.TEST_CARD_NUMBER).replace(" ", "")
+        logger.debug("Filling card number field with '%s'...", card_number)
 
         try:
-            if self.is_element_present(self.CARD_NUMBER_FIELD):
-                self.send_keys_to_element(self.CARD_NUMBER_FIELD, card_number)
-            elif self.is_element_present(self.ALT_CARD_FIELD):
-                self.send_keys_to_element(self.ALT_CARD_FIELD, card_number)
+            if self.TYPE_CARD_IN_CHUNKS:
+                card_field = self._fill_field(self.CARD_NUMBER_FIELDS, card_number[:4])
+                self._wait_for_field_value(card_field, card_number[:4])
+                for i in range(4, len(card_number), 4):
+                    card_field.send_keys(card_number[i:i+4])
+                    # Let Stripe's input mask process the chunk before typing the next one
+                    self._wait_for_field_value(card_field, card_number[:i+4])
             else:
-                card_field = self.driver.find_element(
-                    By.XPATH, "//input[contains(@placeholder, 'card') or contains(@placeholder, 'Card') or contains(@name, 'card')]"
-                )
-                card_field.clear()
-                card_field.send_keys(card_number)
-            print("Card number field filled successfully.")
+                self._fill_field(self.CARD_NUMBER_FIELDS, card_number)
+            logger.debug("Card number field filled successfully.")
         except Exception as e:
-            print(f"[ERROR] Failed to fill card number field: {e}")
+            logger.error("Failed to fill card number field: %s", e)
             raise
 
     def fill_expiry_field(self, expiry=None):
         """
-        Fill expiry date field.
+        Fill expiry date field, typed as MMYY (e.g. "0124").
         """
         expiry = expiry or self.TEST_EXPIRY
-        print(f"Filling expiry date field with '{expiry}'...")
+        logger.debug("Filling expiry date field with '%s'...", expiry)
 
         try:
-            if self.is_element_present(self.EXPIRY_FIELD):
-                self.send_keys_to_element(self.EXPIRY_FIELD, expiry)
-            elif self.is_element_present(self.ALT_EXPIRY_FIELD):
-                self.send_keys_to_element(self.ALT_EXPIRY_FIELD, expiry)
-            else:
-                expiry_field = self.driver.find_element(
-                    By.XPATH, "//input[contains(@placeholder, 'expir') or contains(@placeholder, 'MM') or contains(@name, 'exp')]"
-                )
-                expiry_field.clear()
-                # Format expiry as "MM / YY" with spaces
-                exp_formatted = expiry.replace("/", " / ")
-                expiry_field.send_keys(exp_formatted)
-            print("Expiry date field filled successfully.")
+            exp_digits = expiry.replace("/", "").replace(" ", "")[:4]
+            # Type month, wait, then type year
+            exp_field = self._fill_field(self.EXPIRY_FIELDS, exp_digits[:2])
+            self._wait_for_field_value(exp_field, exp_digits[:2])
+            exp_field.send_keys(exp_digits[2:])
+            self._wait_for_field_value(exp_field, exp_digits)
+            exp_field.send_keys(Keys.TAB)
+            logger.debug("Expiry date field filled successfully.")
         except Exception as e:
-            print(f"[ERROR] Failed to fill expiry date field: {e}")
+            logger.error("Failed to fill expiry date field: %s", e)
             raise
 
     def fill_cvc_field(self, cvc=None):
@@ -170,22 +257,13 @@ class PaymentPage(BasePage):
         Fill CVC field.
         """
         cvc = cvc or self.TEST_CVC
-        print(f"Filling CVC field with '{cvc}'...")
+        logger.debug("Filling CVC field with '%s'...", cvc)
 
         try:
-            if self.is_element_present(self.CVC_FIELD):
-                self.send_keys_to_element(self.CVC_FIELD, cvc)
-            elif self.is_element_present(self.ALT_CVC_FIELD):
-                self.send_keys_to_element(self.ALT_CVC_FIELD, cvc)
-            else:
-                cvc_field = self.driver.find_element(
-                    By.XPATH, "//input[contains(@placeholder, 'CVC') or contains(@placeholder, 'cvc') or contains(@name, 'cvc')]"
-                )
-                cvc_field.clear()
-                cvc_field.send_keys(cvc)
-            print("CVC field filled successfully.")
+            self._fill_field(self.CVC_FIELDS, cvc).send_keys(Keys.TAB)
+            logger.debug("CVC field filled successfully.")
         except Exception as e:
-            print(f"[ERROR] Failed to fill CVC field: {e}")
+            logger.error("Failed to fill CVC field: %s", e)
             raise
 
     def fill_zip_field(self, zip_code=None):
@@ -194,143 +272,83 @@ class PaymentPage(BasePage):
         This field might be optional, so failure here doesn't block the flow.
         """
         zip_code = zip_code or self.TEST_ZIP
-        print(f"Attempting to fill ZIP/postal code field with '{zip_code}' (optional)...")
+        logger.debug("Attempting to fill ZIP/postal code field with '%s' (optional)...", zip_code)
 
         try:
-            if self.is_element_present(self.ZIP_FIELD):
-                self.send_keys_to_element(self.ZIP_FIELD, zip_code)
-                print("ZIP/postal code field filled successfully.")
-            elif self.is_element_present(self.ALT_ZIP_FIELD):
-                self.send_keys_to_element(self.ALT_ZIP_FIELD, zip_code)
-                print("ZIP/postal code field filled successfully (alternative locator).")
-            else:
-                zip_field = self.driver.find_element(
-                    By.XPATH, "//input[contains(@placeholder, 'zip') or contains(@placeholder, 'postal') or contains(@name, 'postal')]"
-                )
-                zip_field.clear()
-                zip_field.send_keys(zip_code)
-                print("ZIP/postal code field filled successfully (by XPath).")
+            # Single lookup without waiting: the form is already loaded and the field is optional
+            zip_field = self.driver.execute_script(self.FIRST_MATCH_SCRIPT, self.ZIP_FIELDS[1])
+            if zip_field is None:
+                logger.debug("ZIP/postal code field not present or not required.")
+                return
+            zip_field.clear()
+            zip_field.send_keys(zip_code)
+            logger.debug("ZIP/postal code field filled successfully.")
         except Exception as e:
-            print(f"[WARN] Could not fill ZIP/postal code field: {e}")
-            print("ZIP/postal code field might be optional, continuing without error.")
+            logger.warning("Could not fill ZIP/postal code field: %s", e)
+            logger.debug("ZIP/postal code field might be optional, continuing without error.")
 
-    def submit_payment_form(self):
+    def _click_submit_button(self):
         """
-        Click the submit/pay button to submit the payment.
+        Click the submit/pay button of the form in the current frame.
         Throws exception if no submit button found or click fails.
         """
-        print("Submitting payment form...")
+        logger.debug("Submitting payment form...")
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe[name^='stripe_checkout_app'], iframe[title*='Stripe']"))
-            )
-            try:
-                payer_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Payer')]")
-                self.driver.execute_script("arguments[0].click();", payer_button)
-                print("Clicked 'Payer' button (JS).")
-            except Exception:
-                submit_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-                self.driver.execute_script("arguments[0].click();", submit_button)
-                print("Clicked submit button (fallback, JS).")
-            self.driver.switch_to.default_content()
-        except Exception as e:
-            print(f"[ERROR] Failed to submit payment form: {e}")
-            self.driver.switch_to.default_content()
-            raise
+            payer_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Payer')]")
+            self.driver.execute_script("arguments[0].click();", payer_button)
+            logger.debug("Clicked 'Payer' button (JS).")
+        except Exception:
+            submit_button = self.driver.find_element(*self.SUBMIT_BUTTON)
+            self.driver.execute_script("arguments[0].click();", submit_button)
+            logger.debug("Clicked submit button (fallback, JS).")
 
-    def fill_payment_form(self, email="test@example.com", card="4242424242424242", exp="1234", cvc="123", zip_code="12345"):
+    def complete_payment(self, email="test@example.com", card="4242424242424242", exp="1234", cvc="123", zip_code="12345"):
         """
-        Orchestrates filling the entire payment form.
-        Waits for form, switches iframe if needed, fills all fields.
-        Raises Exception on failure.
+        Fill and submit the Stripe payment form, then wait for confirmation.
+        Enters the Stripe iframe once, fills every field, submits and switches back.
+        Returns True if payment success detected, else False.
+        Raises Exception if the form does not load or a required field cannot be filled.
         """
-        print("Starting payment form fill procedure...")
+        logger.debug("Starting payment procedure...")
 
-        if not self.wait_for_payment_form():
+        if self.wait_for_payment_form() is None:
             raise Exception("Payment form did not load properly within expected time.")
 
-        # Switch to the Stripe Checkout popup iframe
-        WebDriverWait(self.driver, 15).until(
-            EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe[name^='stripe_checkout_app'], iframe[title*='Stripe']"))
-        )
-
-        # Fill email
-        email_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='email']")
-        email_field.clear()
-        email_field.send_keys(email)
-        print("Email field filled.")
-
-        # Fill card number (send in 4-digit chunks)
-        card_field = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder*='carte'], input[placeholder*='card']")
-        card_field.clear()
-        card_number = card.replace(" ", "")
-        for i in range(0, len(card_number), 4):
-            chunk = card_number[i:i+4]
-            card_field.send_keys(chunk)
-            time.sleep(0.2)  # Small delay to mimic human typing and allow Stripe's JS to process
-        print("Card number filled.")
-
-        # Fill expiry (send as MMYY, e.g., "0124")
-        exp_field = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder*='MM'], input[aria-label*='Expiration'], input[name*='exp']")
-        exp_field.clear()
-        exp_digits = exp.replace("/", "").replace(" ", "")[:4]
-        # Type month, wait, then type year
-        exp_field.send_keys(exp_digits[:2])
-        time.sleep(0.2)
-        exp_field.send_keys(exp_digits[2:])
-        time.sleep(0.2)
-        exp_field.send_keys(Keys.TAB)
-        print("Expiry filled.")
-
-        # Fill CVC
-        cvc_field = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder*='CVV'], input[placeholder*='CVC']")
-        cvc_field.clear()
-        cvc_field.send_keys(cvc)
-        cvc_field.send_keys(Keys.TAB)
-        print("CVC filled.")
-
-        # Fill ZIP/postal code if present
         try:
-            zip_field = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder*='ZIP'], input[placeholder*='zip'], input[placeholder*='Code postal']")
-            zip_field.clear()
-            zip_field.send_keys(zip_code)
-            print("ZIP/postal code filled.")
-        except Exception:
-            print("ZIP/postal code field not present or not required.")
-
-        self.driver.switch_to.default_content()
-        print("Payment form filled successfully.")
+            # Every field is typed with send_keys so Stripe's own input listeners see the value
+            self.fill_email_field(email)
+            self.fill_card_number_field(card)
+            self.fill_expiry_field(exp)
+            self.fill_cvc_field(cvc)
+            # Stripe only renders the ZIP input once a card number has been entered
+            self.fill_zip_field(zip_code)
+            self._click_submit_button()
+        finally:
+            self.driver.switch_to.default_content()
 
-    def submit_payment(self):
-        """
-        Submits the payment form and waits for confirmation message.
-        Returns True if payment success detected, else False.
-        """
         try:
-            self.submit_payment_form()
-            print("Payment form submitted, awaiting success confirmation...")
-
-            WebDriverWait(self.driver, 10).until(
-                lambda d: (
-                    self.is_element_present(self.SUCCESS_MESSAGE, 2) or
-                    self.is_element_present(self.ALT_SUCCESS_MESSAGE, 2)
+            logger.debug("Payment form submitted, awaiting success confirmation...")
+            self.wait.until(
+                EC.any_of(
+                    EC.presence_of_element_located(self.SUCCESS_MESSAGE),
+                    EC.presence_of_element_located(self.ALT_SUCCESS_MESSAGE)
                 )
             )
-
-            print("Payment successful!")
+            logger.info("Payment successful!")
             return True
-
-        except Exception as e:
-            print(f"[ERROR] Payment submission failed or success message not found: {e}")
+        except TimeoutException as e:
+            logger.error("Payment success message not found: %s", e)
             return False
+
     def is_payment_successful(self):
         """
         Check if payment was successful by looking for success message.
+        This is an instant check without waiting; complete_payment already waits for the message.
         Returns True if success message found, else False.
         """
         try:
-            print("Checking for payment success message...")
-            return self.is_element_present(self.SUCCESS_MESSAGE) or self.is_element_present(self.ALT_SUCCESS_MESSAGE)
+            logger.debug("Checking for payment success message...")
+            return bool(self.driver.find_elements(*self.ANY_SUCCESS_MESSAGE))
         except Exception as e:
-            print(f"[ERROR] Error checking payment success: {e}")
+            logger.error("Error checking payment success: %s", e)
             return False
\ No newline at end of file
@@ -10,7 +10,10 @@ from pages.base_page import BasePage
 import re
 import logging
 from typing import List, Tuple, Optional, Dict, Union
-import time
+
+
+# Matches every non-digit character, e.g. "Price: Rs. 365" -> "365"
+_NON_DIGIT_RE = re.compile(r'\D')
 
 
 class ProductPage(BasePage):
@@ -24,8 +27,30 @@ class ProductPage(BasePage):
         (By.CSS_SELECTOR, "button[onclick*='cart']")
     ]
     
+    # Returns the text of the cart indicator in the navbar ("Empty", "1 item(s)", ...)
+    CART_COUNTER_SCRIPT = "return document.getElementById('cart').textContent;"
+    
+    # Returns name and price text for every product card in one round-trip
+    PRODUCT_CARDS_SCRIPT = """
+        return Array.from(document.querySelectorAll('.col-4')).map((card, index) => {
+            const paragraphs = Array.from(card.querySelectorAll('p'));
+            const priceParagraph = paragraphs.find(p => p.innerText.includes('Price'));
+            return {
+                index: index,
+                name: paragraphs.length ? paragraphs[0].innerText.trim() : null,
+                priceText: priceParagraph ? priceParagraph.innerText : null
+            };
+        });
+    """
+    
     def get_all_products(self):
-        """Get all products from the current page"""
+        """
+        Get all products from the current page.
+        
+        Card texts are read in a single browser call. Products only keep their
+        card index; WebElements are looked up when needed (see get_product_card)
+        so no stale references are held across page updates.
+        """
         logging.info(f"Current URL: {self.driver.current_url}")
         
         # Wait for products to load
@@ -34,76 +59,53 @@ class ProductPage(BasePage):
         )
         
         # Get all product cards
-        product_elements = self.driver.find_elements(By.CSS_SELECTOR, ".col-4")
-        logging.info(f"Found {len(product_elements)} product elements")
+        cards = self.driver.execute_script(self.PRODUCT_CARDS_SCRIPT)
+        logging.info(f"Found {len(cards)} product elements")
         
         all_products = []
         
-        for i, elem in enumerate(product_elements):
+        for card in cards:
             try:
-                # Get product name from first p tag
-                paragraphs = elem.find_elements(By.TAG_NAME, "p")
-                if not paragraphs:
+                name = card["name"]
+                if not name:
                     continue
-                    
-                name = paragraphs[0].text.strip()
-                
-                # Get price from second p tag that contains "Price"
-                price_text = None
-                for p in paragraphs:
-                    if "Price" in p.text:
-                        price_text = p.text
-                        break
                 
+                price_text = card["priceText"]
                 if not price_text:
                     logging.warning(f"No price found for product: {name}")
                     continue
                     
                 # Extract price number
-                price = int(''.join(filter(str.isdigit, price_text)))
-                
-                # Get add button
-                add_button = elem.find_element(By.TAG_NAME, "button")
+                price = int(_NON_DIGIT_RE.sub('', price_text))
                 
                 product = {
                     "name": name,
                     "price": price,
-                    "element": elem,
-                    "add_to_cart_button": add_button
+                    "index": card["index"]
                 }
                 
                 all_products.append(product)
                 logging.info(f"Added product: {name} - Price: {price}")
                 
             except Exception as e:
-                logging.warning(f"Error parsing product {i}: {e}")
+                logging.warning(f"Error parsing product {card.get('index')}: {e}")
                 continue
         
         logging.info(f"Successfully parsed {len(all_products)} products")
         return all_products
-
     
-    def _extract_price_from_card(self, card) -> float:
+    def get_product_card(self, product: Dict):
         """
-        Extract price from product card.
+        Look up the card WebElement of a product by its index.
         
         Args:
-            card: WebElement representing a product card.
+            product: Product dictionary as returned by get_all_products.
             
         Returns:
-            float: price value or 0.0 if not found or error.
+            WebElement of the product card, located fresh so it is never stale.
         """
-        try:
-            text_elements = card.find_elements(By.TAG_NAME, "p")
-            for element in text_elements:
-                text = element.text
-                if '$' in text:
-                    price_match = re.search(r'\$(\d+(?:\.\d{2})?)', text)
-                    if price_match:
-                        return float(price_match.group(1))
-            return 0.0
-        except Exception:
-            return 0.0
+        return self.find_elements(self.PRODUCT_CARDS)[product['index']]
+
     
     def filter_products_by_ingredient(self, products: List[Dict], ingredient: str) -> List[Dict]:
         """
@@ -159,10 +161,16 @@ class ProductPage(BasePage):
         """
         all_products = self.get_all_products()
         
-        aloe_products = self.filter_products_by_ingredient(all_products, 'Aloe')
-        cheapest_aloe = self.find_cheapest_product(aloe_products)
+        # Bucket both ingredients in a single pass over the products
+        aloe_products, almond_products = [], []
+        for product in all_products:
+            name = product["name"].lower()
+            if "aloe" in name:
+                aloe_products.append(product)
+            if "almond" in name:
+                almond_products.append(product)
         
-        almond_products = self.filter_products_by_ingredient(all_products, 'Almond')
+        cheapest_aloe = self.find_cheapest_product(aloe_products)
         cheapest_almond = self.find_cheapest_product(almond_products)
         
         return cheapest_aloe, cheapest_almond
@@ -176,10 +184,16 @@ class ProductPage(BasePage):
         """
         all_products = self.get_all_products()
         
-        spf30_products = self.filter_products_by_ingredient(all_products, 'SPF-30')
-        cheapest_spf30 = self.find_cheapest_product(spf30_products)
+        # Bucket both SPF values in a single pass over the products
+        spf30_products, spf50_products = [], []
+        for product in all_products:
+            name = product["name"]
+            if "SPF-30" in name or "SPF 30" in name:
+                spf30_products.append(product)
+            if "SPF-50" in name or "SPF 50" in name:
+                spf50_products.append(product)
         
-        spf50_products = self.filter_products_by_ingredient(all_products, 'SPF-50')
+        cheapest_spf30 = self.find_cheapest_product(spf30_products)
         cheapest_spf50 = self.find_cheapest_product(spf50_products)
         
         return cheapest_spf30, cheapest_spf50
@@ -189,14 +203,16 @@ class ProductPage(BasePage):
         Add a specific product to cart by clicking the Add button.
         
         Args:
-            product: Product dictionary with 'add_to_cart_button' WebElement.
+            product: Product dictionary as returned by get_all_products.
         
         Raises:
             Exception: if product or button is invalid.
         """
-        if product and product.get('add_to_cart_button'):
+        if product:
+            name = product.get('name', 'Unknown')
             try:
-                button = product['add_to_cart_button']
+                # Resolve the Add button right before clicking to avoid stale references
+                button = self.get_product_card(product).find_element(By.TAG_NAME, "button")
                 
                 # Wait for button to be clickable before clicking
                 WebDriverWait(self.driver, 5).until(
@@ -204,29 +220,30 @@ class ProductPage(BasePage):
                 )
                 
                 # Scroll to button to ensure it's visible
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                time.sleep(0.5)
+                self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", button)
+                
+                # Click using JavaScript to ensure the onclick handler executes,
+                # reading the cart indicator beforehand in the same call
+                cart_before = self.driver.execute_script(
+                    "const before = document.getElementById('cart').textContent;"
+                    " arguments[0].click(); return before;",
+                    button
+                )
+                logging.info("Successfully clicked add to cart for: %s", name)
                 
-                # Click using JavaScript to ensure the onclick handler executes
-                self.driver.execute_script("arguments[0].click();", button)
-                logging.info(f"Successfully clicked add to cart for: {product.get('name', 'Unknown')}")
+                # Wait for cart to update - one script call per poll reads the cart indicator
+                def cart_updated(driver):
+                    cart_text = driver.execute_script(self.CART_COUNTER_SCRIPT)
+                    return cart_text if cart_text != cart_before else False
                 
-                # Wait for cart to update - check cart indicator
                 try:
-                    # Wait for cart to show something other than "Empty"
-                    WebDriverWait(self.driver, 5).until(
-                        lambda d: d.find_element(By.ID, "cart").text != "Empty"
-                    )
-                    cart_text = self.driver.find_element(By.ID, "cart").text
-                    logging.info(f"Cart updated to: {cart_text}")
+                    cart_text = WebDriverWait(self.driver, 5, poll_frequency=0.1).until(cart_updated)
+                    logging.info("Cart updated to: %s", cart_text)
                 except:
                     logging.warning("Cart indicator didn't update or couldn't be found")
                 
-                # Additional wait for any async operations
-                time.sleep(1)
-                
             except Exception as e:
-                logging.error(f"Failed to click add to cart button for {product.get('name', 'Unknown')}: {e}")
+                logging.error("Failed to click add to cart button for %s: %s", name, e)
                 raise
         else:
             raise Exception(f"Cannot add product to cart: {product}")
@@ -266,7 +283,7 @@ class ProductPage(BasePage):
         """Navigate to shopping cart page by clicking the cart button/link."""
         cart_btn = self.driver.find_element(By.ID, "cart")
         cart_btn.click()
-        time.sleep(2)  # Give time for navigation
+        WebDriverWait(self.driver, 5).until(EC.url_contains("cart"))
     
     def get_product_count_on_page(self) -> int:
         """